@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import keyword
 import logging
 import math
@@ -904,12 +905,18 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         self._name: str = name
         self._divisions: tuple[int, ...] | tuple[None, ...] = divisions
         self._meta: ak.Array = meta
+        self._cached_keys: NestedKeys | None = None
 
     def __dask_graph__(self) -> HighLevelGraph:
         return self.dask
 
     def __dask_keys__(self) -> NestedKeys:
-        return [(self.name, i) for i in range(self.npartitions)]
+        # dask calls this many times during graph construction and
+        # optimization; build the keys once and hand out the same list.
+        # callers must treat it as read-only.
+        if self._cached_keys is None:
+            self._cached_keys = [(self.name, i) for i in range(self.npartitions)]
+        return self._cached_keys
 
     def __dask_layers__(self) -> tuple[str]:
         return (self.name,)
@@ -965,6 +972,8 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         self._meta = appended._meta
         self._dask = appended._dask
         self._name = appended._name
+        self._cached_keys = None
+        self.__dict__.pop("keys_array", None)
 
     def _rebuild(self, dsk, *, rename=None):
         name = self.name
@@ -1238,10 +1247,18 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
         from dask.array.slicing import normalize_index
 
         raw = normalize_index(index, (self.npartitions,))
-        index = tuple(slice(k, k + 1) if isinstance(k, Number) else k for k in raw)  # type: ignore
         name = f"partitions-{token}"
-        new_keys = self.keys_array[index].tolist()
-        dsk = {(name, i): tuple(key) for i, key in enumerate(new_keys)}
+        # index the list of keys directly; normalize_index leaves us
+        # with a single int, slice, or integer array.
+        keys = self.__dask_keys__()
+        idx = raw[0]
+        if isinstance(idx, slice):
+            new_keys = keys[idx]
+        elif isinstance(idx, (int, np.integer)):
+            new_keys = [keys[idx]]
+        else:
+            new_keys = [keys[i] for i in idx]
+        dsk = {(name, i): key for i, key in enumerate(new_keys)}
         graph = HighLevelGraph.from_collections(
             name,
             AwkwardMaterializedLayer(dsk, previous_layer_names=[self.name]),
@@ -1606,6 +1623,11 @@ class Array(DaskMethodsMixin, NDArrayOperatorsMixin):
             else:
                 if hasattr(cls_method, "_dask_get"):
                     return cls_method._dask_get(self._meta, type(self._meta), self)
+                # other private names (e.g. IPython probing for _repr_*_
+                # hooks) are never mapped over the partitions; bail out
+                # before building any graph.
+                elif attr.startswith("_"):
+                    raise AttributeError(f"{attr} not in fields.")
                 elif self._is_method_heuristic(cls_method):
 
                     @wraps(cls_method)
@@ -2025,11 +2047,12 @@ def _map_partitions(
     will not be traversed to extract all dask collections, except those in
     the first dimension of args or kwargs.
     """
-    if isinstance(fn, ArgsKwargsPackedFunction):
-        token_args, token_kwargs = fn._repack(*args)
-        token = token or tokenize(fn.fn, *token_args, output_divisions, **token_kwargs)
-    else:
-        token = token or tokenize(fn, *args, output_divisions, **kwargs)
+    if token is None:
+        if isinstance(fn, ArgsKwargsPackedFunction):
+            token_args, token_kwargs = fn._repack(*args)
+            token = tokenize(fn.fn, *token_args, output_divisions, **token_kwargs)
+        else:
+            token = tokenize(fn, *args, output_divisions, **kwargs)
 
     label = hyphenize(label or funcname(fn))
     name = f"{label}-{token}"
@@ -2213,6 +2236,10 @@ def map_partitions(
         kwarg_repacker,
         arg_lens_for_repackers,
     )
+    # tokenize the original (unflattened) arguments here so that
+    # _map_partitions doesn't have to run the repackers just to
+    # compute the token.
+    token = token or tokenize(base_fn, *args, output_divisions, **kwargs)
     return _map_partitions(
         fn,
         *arg_flat_deps_expanded,
@@ -2230,7 +2257,10 @@ def _chunk_reducer_non_positional(
     *,
     reducer: Callable,
     mask_identity: bool,
+    prepare_axis_none: bool = False,
 ) -> ak.Array:
+    if prepare_axis_none:
+        chunk = _prepare_axis_none_chunk(chunk)
     return reducer(
         chunk,
         keepdims=True,
@@ -2307,14 +2337,6 @@ def non_trivial_reduction(
     # if is_positional:
     #     assert combiner is reducer
 
-    # For `axis=None`, we prepare each array to have the following structure:
-    #   [[[ ... [x1 x2 x3 ... xN] ... ]]] (length-1 outer lists)
-    # This makes the subsequent reductions an `axis=-1` reduction
-    if axis is None:
-        prepared_array = map_partitions(_prepare_axis_none_chunk, array)
-    else:
-        prepared_array = array
-
     from dask_awkward.layers import AwkwardTreeReductionLayer
 
     token = token or tokenize(
@@ -2331,11 +2353,17 @@ def non_trivial_reduction(
     name_tree_node = f"{label}-tree-node-{token}"
     name_finalize = f"{label}-finalize-{token}"
 
+    # For `axis=None`, we prepare each chunk to have the following structure:
+    #   [[[ ... [x1 x2 x3 ... xN] ... ]]] (length-1 outer lists)
+    # This makes the subsequent reductions an `axis=-1` reduction. The
+    # preparation happens in the same task as the first reduction so
+    # that we don't create an extra partitionwise layer.
     chunked_fn = partial(
         _chunk_reducer_non_positional,
         reducer=reducer,
         is_axis_none=axis is None,
         mask_identity=mask_identity,
+        prepare_axis_none=axis is None,
     )
     tree_node_fn = partial(
         _chunk_reducer_non_positional,
@@ -2359,12 +2387,12 @@ def non_trivial_reduction(
     else:
         pass
 
-    chunked = map_partitions(chunked_fn, prepared_array, meta=empty_typetracer())
+    chunked = map_partitions(chunked_fn, array, meta=empty_typetracer())
 
     trl = AwkwardTreeReductionLayer(
         name=name_finalize,
         name_input=chunked.name,
-        npartitions_input=prepared_array.npartitions,
+        npartitions_input=array.npartitions,
         concat_func=concat_fn,
         tree_node_func=tree_node_fn,
         finalize_func=finalize_fn,
@@ -2711,9 +2739,11 @@ def normalize_single_outer_inner_index(
         index = divisions[-1] + index
     if len(divisions) == 2:
         return (0, int(index))
-    partition_index = int(np.digitize(index, divisions)) - 1
+    # same as np.digitize for increasing divisions, without creating
+    # an array for a single scalar lookup.
+    partition_index = bisect.bisect_right(divisions, index) - 1
     new_index = index - divisions[partition_index]
-    return (int(partition_index), int(new_index))
+    return (partition_index, int(new_index))
 
 
 def make_unknown_length(array: ak.Array) -> ak.Array:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, Protocol, TypeVar, cast
 
 import awkward as ak
+import cachetools
 from awkward import Array as AwkwardArray
 from awkward.forms import Form
 from awkward.typetracer import typetracer_from_form, typetracer_with_report
@@ -31,6 +33,11 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# typetracer layouts built from forms, keyed by the form's compact
+# (non-verbose) JSON. the layouts carry no behavior or attrs, so they can be shared between
+# collections and wrapped in a fresh high-level array on each use.
+_mock_layout_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=64)
+
 
 class ImplementsColumnProjectionMixin(ImplementsNecessaryColumns, Protocol):
     @property
@@ -62,10 +69,17 @@ class ColumnProjectionMixin(ImplementsNecessaryColumns[FormStructure]):
     """
 
     def mock(self: S) -> AwkwardArray:
-        return cast(
-            AwkwardArray,
-            typetracer_from_form(self.form, behavior=self.behavior, attrs=self.attrs),
-        )
+        # building a typetracer walks the whole form and is an order of
+        # magnitude slower than serializing it; reading the same
+        # dataset again should not pay for it twice. Form.to_json is
+        # verbose and about 3x slower than the compact dict.
+        key = json.dumps(self.form.to_dict(verbose=False))
+        try:
+            layout = _mock_layout_cache[key]
+        except KeyError:
+            layout = typetracer_from_form(self.form, highlevel=False)
+            _mock_layout_cache[key] = layout
+        return AwkwardArray(layout, behavior=self.behavior, attrs=self.attrs)
 
     def mock_empty(self: S, backend: BackendT = "cpu") -> AwkwardArray:
         return cast(
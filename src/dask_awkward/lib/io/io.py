@@ -12,7 +12,7 @@ import dask.config
 import numpy as np
 from awkward.types.numpytype import primitive_to_dtype
 from awkward.typetracer import length_zero_if_typetracer
-from dask.base import flatten, tokenize
+from dask.base import tokenize
 from dask.highlevelgraph import HighLevelGraph
 from dask.local import identity
 from dask.utils import funcname, is_integer, parse_bytes
@@ -69,8 +69,13 @@ class FromAwkwardFn(ColumnProjectionMixin):
 
     def __call__(self, *args, **kwargs):
         start, stop = args[0]
-        arr = cast(ak.Array, self.arr[start:stop])
-        return ak.Array(arr, behavior=self.behavior, attrs=self.attrs)
+        # slice the layout (a cheap view) and wrap it once, instead of
+        # going through the highlevel __getitem__ and re-wrapping.
+        return ak.Array(
+            self.arr.layout[start:stop],
+            behavior=self.behavior,
+            attrs=self.attrs,
+        )
 
     def project_columns(self, columns):
         return type(self)(self.arr, self.behavior, self.attrs)
@@ -356,23 +361,29 @@ def to_dask_array(
             no_primitive = not hasattr(content, "primitive")
         dtype = dtype or primitive_to_dtype(content.primitive)
 
+        from dask.blockwise import blockwise as dask_blockwise
+
         name = f"to-dask-array-{tokenize(array)}"
         nan_tuples_innerdims = ((np.nan,),) * (ndim - 1)
         chunks = ((np.nan,) * array.npartitions, *nan_tuples_innerdims)
-        zeros = (0,) * (ndim - 1)
-
-        # eventually convert to HLG (if possible)
-        llg = {
-            (name, i, *zeros): (ak.to_numpy, k)
-            for i, k in enumerate(flatten(array.__dask_keys__()))
-        }
 
+        # the inner dimensions are always a single block, so we add
+        # them as new (length 1) axes to a Blockwise layer instead of
+        # materializing one task per partition.
+        out_ind = "ijklmnopqrstuvwxyz"[:ndim]
+        layer = dask_blockwise(
+            ak.to_numpy,
+            name,
+            out_ind,
+            array.name,
+            "i",
+            numblocks={array.name: (array.npartitions,)},
+            new_axes={idx: 1 for idx in out_ind[1:]},
+            concatenate=True,
+        )
         graph = HighLevelGraph.from_collections(
             name,
-            AwkwardMaterializedLayer(
-                llg,
-                previous_layer_names=[array.name],
-            ),
+            AwkwardBlockwiseLayer.from_blockwise(layer),
             dependencies=[array],
         )
         return new_da_object(graph, name, meta=None, chunks=chunks, dtype=dtype)
@@ -2,19 +2,22 @@ from __future__ import annotations
 
 import abc
 import logging
-import math
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 import awkward as ak
+import cachetools
 import dask
+import numpy as np
 from awkward.forms.form import Form
+from awkward.types.numpytype import primitive_to_dtype
 from dask.base import tokenize
 from dask.blockwise import BlockIndex
 from dask.core import flatten
 from dask.highlevelgraph import HighLevelGraph
 from dask.utils import parse_bytes
-from fsspec.core import get_fs_token_paths, url_to_fs
+from fsspec.core import OpenFile, get_fs_token_paths, url_to_fs
 from fsspec.utils import infer_compression, read_block
 
 from dask_awkward.layers.layers import AwkwardMaterializedLayer
@@ -40,20 +43,75 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _length_one_array(obj: Any) -> ak.Array:
+    """Wrap the result of a single-object ak.from_json call in a length-1 Array.
+
+    Avoids ``ak.Array([obj])``, which walks the already parsed
+    result again with ``ak.from_iter``.
+
+    """
+    if isinstance(obj, ak.Record):
+        layout = obj.layout
+        return ak.Array(
+            layout.array[layout.at : layout.at + 1],
+            behavior=obj.behavior,
+            attrs=obj.attrs,
+        )
+    elif isinstance(obj, ak.Array):
+        layout = obj.layout
+        offsets = ak.index.Index64(np.array([0, len(layout)], dtype=np.int64))
+        return ak.Array(
+            ak.contents.ListOffsetArray(offsets, layout),
+            behavior=obj.behavior,
+            attrs=obj.attrs,
+        )
+    # top level JSON scalar (number, string, ...)
+    return ak.Array([obj])
+
+
+_jsonschema_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=256)
+
+
+def _jsonschema_for_columns(form: Form, columns: Iterable[str]) -> dict:
+    """JSON schema that reads only `columns` of `form` (cached).
+
+    The optimizer can project the same input many times (every
+    optimized compute of a collection built on the same files); the
+    form selection and schema generation is a pure function of the
+    form and the columns so we only do it once. The returned
+    dictionary is shared between callers and must not be mutated.
+
+    """
+    columns = tuple(columns)
+    key = (form.to_json(), columns)
+    try:
+        return _jsonschema_cache[key]
+    except KeyError:
+        pass
+    selected = form.select_columns(columns)
+    assert selected is not None
+    schema = _form_to_jsonschema(selected)
+    _jsonschema_cache[key] = schema
+    return schema
+
+
+def _log_columns_read(array: ak.Array) -> None:
+    # walking the form for its columns isn't free; skip it entirely
+    # unless someone is actually looking at the debug logs.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("columns read from disk: %s", array.layout.form.columns())
+
+
 class FromJsonFn(ColumnProjectionMixin):
     def __init__(
         self,
         *,
-        storage: AbstractFileSystem,
         form: Form,
-        compression: str | None = None,
         schema: str | dict | list | None = None,
         behavior: Mapping | None = None,
         attrs: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
-        self.compression = compression
-        self.storage = storage
         self.schema = schema
         self.kwargs = kwargs
         self.form = form
@@ -75,15 +133,11 @@ class FromJsonFn(ColumnProjectionMixin):
         )
 
     def project_columns(self, columns):
-        form = self.form.select_columns(columns)
-        assert form is not None
-        schema = layout_to_jsonschema(form.length_zero_array(highlevel=False))
+        schema = _jsonschema_for_columns(self.form, columns)
 
         return type(self)(
             schema=schema,
             form=self.form,
-            storage=self.storage,
-            compression=self.compression,
             behavior=self.behavior,
             **self.kwargs,
         )
@@ -93,17 +147,13 @@ class FromJsonLineDelimitedFn(FromJsonFn):
     def __init__(
         self,
         *,
-        storage: AbstractFileSystem,
         form: Form,
-        compression: str | None = None,
         schema: str | dict | list | None = None,
         behavior: Mapping | None = None,
         attrs: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
-            storage=storage,
-            compression=compression,
             schema=schema,
             form=form,
             behavior=behavior,
@@ -111,15 +161,17 @@ class FromJsonLineDelimitedFn(FromJsonFn):
             **kwargs,
         )
 
-    def __call__(self, source: str) -> ak.Array:
-        with self.storage.open(source, mode="rt", compression=self.compression) as f:
+    def __call__(self, source: OpenFile) -> ak.Array:
+        # read raw bytes; ak.from_json parses them natively so there
+        # is no need to pay for decoding to str first.
+        with source as f:
             array = ak.from_json(
                 f.read(),
                 line_delimited=True,
                 schema=self.schema,
                 **self.kwargs,
             )
-        log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
+        _log_columns_read(array)
         assert isinstance(array, ak.Array)
         return array
         # return ak.Array(unproject_layout(self.original_form, array.layout))
@@ -129,17 +181,13 @@ class FromJsonSingleObjPerFile(FromJsonFn):
     def __init__(
         self,
         *,
-        storage: AbstractFileSystem,
         form: Form,
-        compression: str | None = None,
         schema: str | dict | list | None = None,
         behavior: Mapping | None = None,
         attrs: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
-            storage=storage,
-            compression=compression,
             schema=schema,
             form=form,
             behavior=behavior,
@@ -147,19 +195,17 @@ class FromJsonSingleObjPerFile(FromJsonFn):
             **kwargs,
         )
 
-    def __call__(self, source: str) -> ak.Array:
-        with self.storage.open(source, mode="rt", compression=self.compression) as f:
-            array = ak.Array(
-                [
-                    ak.from_json(
-                        f.read(),
-                        line_delimited=False,
-                        schema=self.schema,
-                        **self.kwargs,
-                    )
-                ]
+    def __call__(self, source: OpenFile) -> ak.Array:
+        with source as f:
+            array = _length_one_array(
+                ak.from_json(
+                    f.read(),
+                    line_delimited=False,
+                    schema=self.schema,
+                    **self.kwargs,
+                )
             )
-        log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
+        _log_columns_read(array)
         assert isinstance(array, ak.Array)
         return array
         # return ak.Array(unproject_layout(self.original_form, array.layout))
@@ -169,17 +215,13 @@ class FromJsonBytesFn(FromJsonFn):
     def __init__(
         self,
         *,
-        storage: AbstractFileSystem,
         form: Form,
-        compression: str | None = None,
         schema: str | dict | list | None = None,
         behavior: Mapping | None = None,
         attrs: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
-            storage=storage,
-            compression=compression,
             schema=schema,
             behavior=behavior,
             attrs=attrs,
@@ -207,12 +249,27 @@ class FromJsonBytesFn(FromJsonFn):
             schema=self.schema,
             **self.kwargs,
         )
-        log.debug("columns read from disk: %s" % str(array.layout.form.columns()))
+        _log_columns_read(array)
         assert isinstance(array, ak.Array)
         return array
         # return ak.Array(unproject_layout(self.original_form, array.layout))
 
 
+def _open_files(
+    fs: AbstractFileSystem,
+    paths: list[str],
+    compression: str | None,
+) -> list[OpenFile]:
+    """Build lazy fsspec OpenFile objects (one per path) at graph construction.
+
+    The file is not opened until the task enters the ``with`` block,
+    so each task only carries an already configured handle instead of
+    resolving the filesystem, mode, and compression on the worker.
+
+    """
+    return [OpenFile(fs, path, mode="rb", compression=compression) for path in paths]
+
+
 def meta_from_single_file(
     *,
     fs: AbstractFileSystem,
@@ -221,7 +278,9 @@ def meta_from_single_file(
     **kwargs: Any,
 ) -> ak.Array:
     with fs.open(paths[0], compression=compression) as f:
-        array = ak.Array([ak.from_json(f.read(), line_delimited=False, **kwargs)])
+        array = _length_one_array(
+            ak.from_json(f.read(), line_delimited=False, **kwargs)
+        )
     return typetracer_array(array)
 
 
@@ -233,11 +292,17 @@ def meta_from_bytechunks(
     **kwargs: Any,
 ) -> ak.Array:
     sample_bytes = parse_bytes(sample_bytes)
-    bytes = fs.cat(paths[0], start=0, end=sample_bytes)
-    rfind = bytes.rfind(b"\n")
+    chunk = fs.cat(paths[0], start=0, end=sample_bytes)
+    # if the first line is longer than the sample we keep requesting
+    # (doubling) byte ranges until we have a complete line or hit the
+    # end of the file instead of parsing a truncated line.
+    while b"\n" not in chunk and len(chunk) == sample_bytes:
+        chunk += fs.cat(paths[0], start=sample_bytes, end=2 * sample_bytes)
+        sample_bytes *= 2
+    rfind = chunk.rfind(b"\n")
     if rfind > 0:
-        bytes = bytes[:rfind]
-    array = ak.from_json(bytes, line_delimited=True, **kwargs)
+        chunk = chunk[:rfind]
+    array = ak.from_json(chunk, line_delimited=True, **kwargs)
     assert isinstance(array, ak.Array)
     return typetracer_array(array)
 
@@ -251,15 +316,13 @@ def meta_from_line_by_line(
     **kwargs: Any,
 ) -> ak.Array:
     if sample_rows is not None:
-        lines = []
-        with fs.open(paths[0], mode="rt", compression=compression) as f:
-            for i, line in enumerate(f):
-                lines.append(line)
-                if i >= sample_rows:
-                    break
-        array = ak.from_json("\n".join(lines), line_delimited=True, **kwargs)
+        with fs.open(paths[0], mode="rb", compression=compression) as f:
+            lines = list(islice(f, sample_rows))
+        # lines keep their trailing newline so a plain join is enough
+        # to hand a single line delimited buffer to ak.from_json.
+        array = ak.from_json(b"".join(lines), line_delimited=True, **kwargs)
     else:
-        with fs.open(paths[0], mode="rt", compression=compression) as f:
+        with fs.open(paths[0], mode="rb", compression=compression) as f:
             array = ak.from_json(
                 f.read(),
                 line_delimited=True,
@@ -280,9 +343,6 @@ def _from_json_files(
     sample_bytes: str | int = "256 KiB",
     **kwargs: Any,
 ) -> Array:
-    if compression == "infer":
-        compression = infer_compression(paths[0])
-
     if not compression:
         meta = meta_from_bytechunks(
             fs=fs,
@@ -299,11 +359,21 @@ def _from_json_files(
             **kwargs,
         )
 
-    token = tokenize(compression, meta, kwargs)
+    # the filesystem token doesn't cover the paths or their contents
+    # (ukey changes when a file is rewritten), and typetracer arrays
+    # don't have a deterministic token (the form carries everything
+    # about the metadata that matters).
+    token = tokenize(
+        token,
+        paths,
+        [fs.ukey(p) for p in paths],
+        schema,
+        compression,
+        meta.layout.form.to_json(),
+        kwargs,
+    )
 
     f = FromJsonLineDelimitedFn(
-        storage=fs,
-        compression=compression,
         schema=schema,
         form=meta.layout.form,
         **kwargs,
@@ -313,7 +383,7 @@ def _from_json_files(
         Array,
         from_map(
             f,
-            paths,
+            _open_files(fs, paths, compression),
             label="from-json-files",
             token=token,
             meta=meta,
@@ -330,20 +400,23 @@ def _from_json_sopf(
     compression: str | None,
     **kwargs: Any,
 ) -> Array:
-    if compression == "infer":
-        compression = infer_compression(paths[0])
-
     meta = meta_from_single_file(
         fs=fs,
         paths=paths,
         compression=compression,
         **kwargs,
     )
-    token = tokenize(token, compression, meta, kwargs)
+    token = tokenize(
+        token,
+        paths,
+        [fs.ukey(p) for p in paths],
+        schema,
+        compression,
+        meta.layout.form.to_json(),
+        kwargs,
+    )
 
     f = FromJsonSingleObjPerFile(
-        storage=fs,
-        compression=compression,
         schema=schema,
         form=meta.layout.form,
         **kwargs,
@@ -353,7 +426,7 @@ def _from_json_sopf(
         Array,
         from_map(
             f,
-            paths,
+            _open_files(fs, paths, compression),
             label="from-json-sopf",
             token=token,
             meta=meta,
@@ -367,20 +440,18 @@ def _from_json_bytes(
     paths: list[str],
     *,
     schema: str | dict | list | None = None,
-    compression: str | None = "infer",
+    compression: str | None = None,
     delimiter: bytes = b"\n",
     not_zero: bool = False,
     blocksize: str | int = "128 MiB",
     sample_bytes: str | int = "10 kiB",
     **kwargs: Any,
 ) -> Array:
-    if compression == "infer":
-        compression = infer_compression(paths[0])
-
     token = tokenize(
         fs,
         token,
         paths,
+        [fs.ukey(p) for p in paths],
         schema,
         compression,
         delimiter,
@@ -405,8 +476,6 @@ def _from_json_bytes(
     meta = typetracer_array(sample_array)
 
     fn = FromJsonBytesFn(
-        storage=fs,
-        compression=compression,
         schema=schema,
         form=meta.layout.form,
         **kwargs,
@@ -568,6 +637,11 @@ def from_json(
     if len(paths) == 0:
         raise OSError("%s resolved to no files" % source)
 
+    # resolve the compression once here; the implementations below
+    # expect a concrete compression (or None).
+    if compression == "infer":
+        compression = infer_compression(paths[0])
+
     # allow either blocksize or delimieter being not-None to trigger
     # line deliminated JSON reading.
     if blocksize is not None and delimiter is None:
@@ -623,6 +697,7 @@ def from_json(
             token=token,
             paths=paths,
             schema=schema,
+            compression=compression,
             delimiter=delimiter,
             blocksize=blocksize,
             sample_bytes=meta_sample_bytes,
@@ -641,6 +716,11 @@ def from_json(
         raise TypeError("Incompatible combination of arguments.")  # pragma: no cover
 
 
+# file extensions for compression names that don't match their usual
+# extension.
+_COMPRESSION_EXTENSIONS = {"gzip": "gz", "zstd": "zst"}
+
+
 class ToJsonFn:
     def __init__(
         self,
@@ -652,28 +732,24 @@ class ToJsonFn:
     ) -> None:
         self.fs = fs
         self.path = path
-        if not self.fs.exists(path):
-            self.fs.mkdir(path)
-        self.zfill = math.ceil(math.log(npartitions, 10))
+        self.zfill = len(str(max(npartitions - 1, 0)))
         self.compression = compression
-        if self.compression == "infer":
-            self.compression = infer_compression(self.path)
         self.kwargs = kwargs
+        self.suffix = ".json"
+        if self.compression is not None:
+            ext = _COMPRESSION_EXTENSIONS.get(self.compression, self.compression)
+            self.suffix = f".json.{ext}"
 
     def __call__(self, array: ak.Array, block_index: tuple[int]) -> None:
         part = str(block_index[0]).zfill(self.zfill)
-        filename = f"part{part}.json"
-        if self.compression is not None and self.compression != "infer":
-            ext = self.compression
-            if ext == "gzip":
-                ext = "gz"
-            if ext == "zstd":
-                ext = "zst"
-            filename = f"{filename}.{ext}"
-
+        filename = f"part{part}{self.suffix}"
         thispath = self.fs.unstrip_protocol(f"{self.path}{self.fs.sep}{filename}")
-        with self.fs.open(thispath, mode="wt", compression=self.compression) as f:
-            ak.to_json(array, f, **self.kwargs)
+        # serialize the whole partition first; handing ak.to_json the
+        # file object means a small write (through the text and
+        # compression layers) for every JSON token.
+        data = ak.to_json(array, **self.kwargs).encode()
+        with self.fs.open(thispath, mode="wb", compression=self.compression) as f:
+            f.write(data)
 
         return None
 
@@ -744,6 +820,12 @@ def to_json(
     """
     storage_options = storage_options or {}
     fs, _ = url_to_fs(path, **storage_options)
+    if compression == "infer":
+        compression = infer_compression(path)
+    # create the output directory once, while building the graph,
+    # rather than leaving it to the write tasks.
+    if not fs.exists(path):
+        fs.mkdir(path)
     nparts = array.npartitions
     map_res = map_partitions(
         ToJsonFn(
@@ -810,20 +892,20 @@ def json_type(original: str | list[str], add_null: bool = False) -> str | list[s
             return original
 
 
-def array_param_is_string_or_bytestring(layout: Content) -> bool:
+def array_param_is_string_or_bytestring(layout: Content | Form) -> bool:
     params = layout.parameters or {}
     return params == {"__array__": "string"} or params == {"__array__": "bytestring"}
 
 
-def layout_to_jsonschema(
-    layout: Content,
-    existing_schema: dict | None = None,
-    title: str = "untitled",
-    description: str = "Auto generated by dask-awkward",
-    required: bool = False,
-    is_option: bool = False,
+def _to_jsonschema(
+    node: Content | Form,
+    existing_schema: dict | None,
+    title: str,
+    description: str,
+    required: bool,
+    is_option: bool,
 ) -> dict:
-    """Convert awkward array Layout to a JSON Schema dictionary."""
+    """Convert an awkward Layout or Form to a JSON Schema dictionary."""
     if existing_schema is None:
         existing_schema = {
             "title": title,
@@ -831,41 +913,82 @@ def layout_to_jsonschema(
             "type": "object",
             "properties": {},
         }
-    if layout.is_option:
-        layout_to_jsonschema(layout.content, existing_schema, is_option=True)
-    elif layout.is_record:
+    is_form = isinstance(node, Form)
+
+    def recurse(content, schema=None, is_option=False):
+        return _to_jsonschema(content, schema, title, description, False, is_option)
+
+    if node.is_option:
+        recurse(node.content, existing_schema, is_option=True)
+    elif node.is_record:
         existing_schema["type"] = json_type("object", add_null=is_option)
         existing_schema["properties"] = {}
         if required:
-            existing_schema["required"] = layout.fields
-        for field in layout.fields:
+            existing_schema["required"] = node.fields
+        for field, content in zip(node.fields, node.contents):
             existing_schema["properties"][field] = {"type": None}
-            layout_to_jsonschema(layout[field], existing_schema["properties"][field])
-    elif (layout.parameters or {}) == {"__array__": "categorical"}:
-        existing_schema["enum"] = layout.content.to_list()
-        existing_schema["type"] = layout_to_jsonschema(layout.content)["type"]
-    elif array_param_is_string_or_bytestring(layout):
+            recurse(content, existing_schema["properties"][field])
+    elif (node.parameters or {}) == {"__array__": "categorical"}:
+        # a form has no categories to enumerate.
+        existing_schema["enum"] = [] if is_form else node.content.to_list()
+        existing_schema["type"] = recurse(node.content)["type"]
+    elif array_param_is_string_or_bytestring(node):
         existing_schema["type"] = json_type("string", add_null=is_option)
-    elif layout.is_list:
+    elif node.is_list:
         existing_schema["type"] = json_type("array", add_null=is_option)
-        if layout.is_regular:
-            existing_schema["minItems"] = layout.size
-            existing_schema["maxItems"] = layout.size
+        if node.is_regular:
+            existing_schema["minItems"] = node.size
+            existing_schema["maxItems"] = node.size
         existing_schema["items"] = {}
-        layout_to_jsonschema(layout.content, existing_schema["items"])
-    elif layout.is_numpy:
-        if layout.dtype.kind == "i":
+        recurse(node.content, existing_schema["items"])
+    elif node.is_numpy:
+        dtype = primitive_to_dtype(node.primitive) if is_form else node.dtype
+        if dtype.kind == "i":
             existing_schema["type"] = json_type("integer", add_null=is_option)
-        elif layout.dtype.kind == "f":
+        elif dtype.kind == "f":
             existing_schema["type"] = json_type("number", add_null=is_option)
-        elif layout.dtype.kind == "b":
+        elif dtype.kind == "b":
             existing_schema["type"] = json_type("boolean", add_null=is_option)
-    elif layout.is_indexed:
+    elif node.is_indexed:
         pass
-    elif layout.is_unknown:
+    elif node.is_unknown:
         existing_schema["type"] = "null"
-    elif layout.is_union:
+    elif node.is_union:
         existing_schema["type"] = [
-            layout_to_jsonschema(content)["type"] for content in layout.contents
+            recurse(content)["type"] for content in node.contents
         ]
     return existing_schema
+
+
+def _form_to_jsonschema(
+    form: Form,
+    existing_schema: dict | None = None,
+    title: str = "untitled",
+    description: str = "Auto generated by dask-awkward",
+    required: bool = False,
+    is_option: bool = False,
+) -> dict:
+    """Convert awkward Form to a JSON Schema dictionary.
+
+    Same result as calling :func:`layout_to_jsonschema` on
+    ``form.length_zero_array(highlevel=False)``, without building the
+    layout first.
+
+    """
+    return _to_jsonschema(
+        form, existing_schema, title, description, required, is_option
+    )
+
+
+def layout_to_jsonschema(
+    layout: Content,
+    existing_schema: dict | None = None,
+    title: str = "untitled",
+    description: str = "Auto generated by dask-awkward",
+    required: bool = False,
+    is_option: bool = False,
+) -> dict:
+    """Convert awkward array Layout to a JSON Schema dictionary."""
+    return _to_jsonschema(
+        layout, existing_schema, title, description, required, is_option
+    )
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import abc
+import collections
 import itertools
 import logging
-import math
 import operator
+import threading
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import awkward as ak
 import awkward.operations.ak_from_parquet as ak_from_parquet
+import cachetools
 import dask
 from awkward.forms.form import Form
 from dask.base import tokenize
@@ -32,6 +34,31 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# parsed parquet footers, keyed by file URL and a hash of the file's
+# properties so that a rewritten file is never read with a stale footer.
+# the cache is used from worker threads and LRUCache is not thread-safe,
+# so every access goes through the lock.
+_footer_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=128)
+_footer_cache_lock = threading.Lock()
+
+
+def _read_footer(fs: AbstractFileSystem, path: str) -> Any:
+    """Return the (per-process cached) footer metadata of a Parquet file."""
+    import pyarrow.parquet as pq
+
+    key = (fs.unstrip_protocol(path), fs.ukey(path))
+    with _footer_cache_lock:
+        metadata = _footer_cache.get(key)
+    if metadata is not None:
+        return metadata
+    # don't hold the lock while reading; at worst two threads parse
+    # the same footer.
+    with fs.open(path, "rb") as f:
+        metadata = pq.ParquetFile(f).metadata
+    with _footer_cache_lock:
+        _footer_cache[key] = metadata
+    return metadata
+
 
 def report_failure(exception, *args, **kwargs):
     return ak.Array(
@@ -83,6 +110,10 @@ class FromParquetFn(ColumnProjectionMixin):
         self.columns = self.form.columns(self.listsep)
         if self.unnamed_root:
             self.columns = [f".{c}" for c in self.columns]
+        # a projection that kept every column has nothing to unproject,
+        # so skip walking each partition's layout against the form.
+        if original_form is not None and original_form == form:
+            original_form = None
         self.original_form = original_form
         self.report = report
         self.allowed_exceptions = allowed_exceptions
@@ -216,25 +247,47 @@ class FromParquetFragmentWiseFn(FromParquetFn):
 
     def __call__(self, pair: Any) -> ak.Array:
         subrg, source = pair
-        if isinstance(subrg, int):
-            subrg = [[subrg]]
-        layout = ak_from_parquet._load(
-            [source],
-            parquet_columns=self.columns,
-            subrg=subrg,
-            subform=self.form,
-            highlevel=False,
-            fs=self.fs,
-            behavior=self.behavior,
-            attrs=self.attrs,
-            **self.kwargs,
-        )
+        subrg = [[subrg]] if isinstance(subrg, int) else [list(subrg)]
+        if getattr(self.fs, "async_impl", False):
+            # remote reads go through fsspec.parquet's byte range
+            # prefetching, which parses the footer itself.
+            layout = ak_from_parquet._load(
+                [source],
+                parquet_columns=self.columns,
+                subrg=subrg,
+                subform=self.form,
+                highlevel=False,
+                fs=self.fs,
+                behavior=self.behavior,
+                attrs=self.attrs,
+                **self.kwargs,
+            )
+        else:
+            layout = self.read_row_groups(source, subrg[0])
         return ak.Array(
             unproject_layout(self.original_form, layout),
             behavior=self.behavior,
             attrs=self.attrs,
         )
 
+    def read_row_groups(self, source: str, row_groups: list[int]) -> Any:
+        # reading many row groups of one file would otherwise re-parse
+        # the same footer once per partition; on wide schemas that
+        # dominates the cost of reading a few columns.
+        import pyarrow.parquet as pq
+
+        metadata = _read_footer(self.fs, source)
+        with self.fs.open(source, "rb") as f:
+            table = pq.ParquetFile(f, metadata=metadata).read_row_groups(
+                row_groups, self.columns
+            )
+        table = ak._connect.pyarrow.convert_native_arrow_table_to_awkward(table)
+        return ak.from_arrow(
+            table,
+            generate_bitmasks=self.kwargs.get("generate_bitmasks", False),
+            highlevel=False,
+        )
+
     def project_columns(self, columns):
         return FromParquetFragmentWiseFn(
             fs=self.fs,
@@ -262,6 +315,7 @@ def from_parquet(
     ignore_metadata: bool = True,
     scan_files: bool = False,
     split_row_groups: bool | None = False,
+    coalesce_row_groups: int | None = None,
     storage_options: dict[str, Any] | None = None,
     report: bool = False,
 ) -> Array | tuple[Array, Array]:
@@ -299,6 +353,11 @@ def from_parquet(
         file becomes a partition. If None, the existence of a
         ``_metadata`` file and ignore_metadata=False implies True,
         else ``False``.
+    coalesce_row_groups
+        When splitting by row group, merge consecutive row groups of
+        the same file into one partition as long as their total
+        (uncompressed) size stays below this many bytes. If ``None``
+        (the default), each row group is its own partition.
     storage_options
         Storage options passed to fsspec.
 
@@ -329,6 +388,7 @@ def from_parquet(
         ignore_metadata,
         scan_files,
         split_row_groups,
+        coalesce_row_groups,
         behavior,
         attrs,
     )
@@ -351,13 +411,11 @@ def from_parquet(
     )
 
     listsep = "list.item"
-    unnamed_root = False
-    for c in parquet_columns:
-        if ".list.element" in c:
-            listsep = "list.element"
-            break
-        if c.startswith("."):
-            unnamed_root = True
+    if any(".list.element" in c for c in parquet_columns):
+        listsep = "list.element"
+    # an unnamed (empty) root field prefixes every column with ".", so
+    # the first column is enough to tell.
+    unnamed_root = bool(parquet_columns) and parquet_columns[0].startswith(".")
 
     if split_row_groups is None:
         split_row_groups = row_counts is not None and len(row_counts) > 1
@@ -384,25 +442,37 @@ def from_parquet(
         )
     else:
         # row-group wise
+        # each row_group() call builds a new pyarrow wrapper object, so
+        # fetch them once and share them between the loops below.
+        rgs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
         if set(subrg) == {None}:
+            # row groups of one file share a file_path, so count them
+            # first and only search the paths once per distinct file_path.
+            fp_counts = collections.Counter(rg.column(0).file_path for rg in rgs)
             rgs_paths = {path: 0 for path in actual_paths}
-            for i in range(metadata.num_row_groups):
-                fp = metadata.row_group(i).column(0).file_path
-                rgs_path = [p for p in rgs_paths if fp in p][
-                    0
-                ]  # returns 1st if fp is empty
-                rgs_paths[rgs_path] += 1
+            for fp, count in fp_counts.items():
+                # returns 1st if fp is empty
+                rgs_paths[next(p for p in actual_paths if fp in p)] += count
 
             subrg = [list(range(rgs_paths[_])) for _ in actual_paths]
 
-        rgs = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
-        divisions = [0] + list(
-            itertools.accumulate([rg.num_rows for rg in rgs], operator.add)
-        )
         pairs = []
-
+        nrows = []
+        start = 0
         for isubrg, path in zip(subrg, actual_paths):
-            pairs.extend([(irg, path) for irg in isubrg])
+            file_rgs = rgs[start : start + len(isubrg)]
+            start += len(isubrg)
+            if coalesce_row_groups is None:
+                pairs.extend([(irg, path) for irg in isubrg])
+                nrows.extend([rg.num_rows for rg in file_rgs])
+                continue
+            groups = _coalesce_row_groups(
+                [rg.total_byte_size for rg in file_rgs], coalesce_row_groups
+            )
+            for group in groups:
+                pairs.append((tuple(isubrg[k] for k in group), path))
+                nrows.append(sum(file_rgs[k].num_rows for k in group))
+        divisions = [0] + list(itertools.accumulate(nrows, operator.add))
 
         return cast(
             Array,
@@ -427,6 +497,37 @@ def from_parquet(
         )
 
 
+def _coalesce_row_groups(sizes: list[int], max_bytes: int) -> list[list[int]]:
+    """Group consecutive row groups so each group stays under `max_bytes`.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Size in bytes of each row group of a single file.
+    max_bytes : int
+        Upper bound on the summed size of a group; a row group larger
+        than this still gets a group of its own.
+
+    Returns
+    -------
+    list[list[int]]
+        Positions (into `sizes`) of the row groups in each group.
+
+    """
+    groups: list[list[int]] = []
+    current: list[int] = []
+    total = 0
+    for i, size in enumerate(sizes):
+        if current and total + size > max_bytes:
+            groups.append(current)
+            current, total = [], 0
+        current.append(i)
+        total += size
+    if current:
+        groups.append(current)
+    return groups
+
+
 def _metadata_file_from_data_files(path_list, fs, out_path):
     """
     Aggregate _metadata and _common_metadata from data files
@@ -470,9 +571,6 @@ def _write_metadata(fs, out_path, meta):
     metadata_path = "/".join([out_path, "_metadata"])
     with fs.open(metadata_path, "wb") as fil:
         meta.write_metadata_file(fil)
-    metadata_path = "/".join([out_path, "_metadata"])
-    with fs.open(metadata_path, "wb") as fil:
-        meta.write_metadata_file(fil)
 
 
 class _ToParquetFn:
@@ -489,7 +587,7 @@ class _ToParquetFn:
         self.fs = fs
         self.path = path
         self.prefix = prefix
-        self.zfill = math.ceil(math.log(npartitions, 10))
+        self.zfill = len(str(max(npartitions - 1, 0)))
         self.storage_options = storage_options
         self.fs.mkdirs(self.path, exist_ok=True)
         self.protocol = (
@@ -499,12 +597,11 @@ class _ToParquetFn:
         )
         self.write_metadata = write_metadata
         self.kwargs = kwargs
+        stem = "part" if self.prefix is None else f"{self.prefix}-part"
+        self.stem = f"{self.fs.unstrip_protocol(self.path)}{self.fs.sep}{stem}"
 
     def __call__(self, data, block_index):
-        filename = f"part{str(block_index[0]).zfill(self.zfill)}.parquet"
-        if self.prefix is not None:
-            filename = f"{self.prefix}-{filename}"
-        filename = self.fs.unstrip_protocol(f"{self.path}{self.fs.sep}{filename}")
+        filename = f"{self.stem}{str(block_index[0]).zfill(self.zfill)}.parquet"
         out = ak.to_parquet(
             data, filename, **self.kwargs, storage_options=self.storage_options
         )
@@ -540,10 +637,12 @@ def to_parquet(
     write_metadata: bool = False,
     compute: bool = True,
     prefix: str | None = None,
+    partitions_per_file: int = 1,
 ) -> Scalar | None:
     """Write data to Parquet format.
 
-    This will create one output file per partition.
+    This will create one output file per partition (or per group of
+    `partitions_per_file` partitions).
 
     See the documentation for :func:`ak.to_parquet` for more
     information; there are many optional function arguments that are
@@ -614,6 +713,10 @@ def to_parquet(
         inside the destination directory will be named
         ``"partN.parquet"``; if defined, the names will be
         ``f"{prefix}-partN.parquet"``.
+    partitions_per_file
+        Number of consecutive partitions to concatenate into each
+        output file. Fewer, larger files mean fewer files opened and
+        footers written, at the cost of more memory per write task.
 
     Returns
     -------
@@ -644,6 +747,11 @@ def to_parquet(
     #  - byte stream split for floats if compression is not None or lzma
     #  - partitioning
     #  - dict encoding always off
+    if partitions_per_file < 1:
+        raise ValueError("partitions_per_file must be a positive integer")
+    if partitions_per_file > 1:
+        array = array.repartition(n_to_one=partitions_per_file)
+
     fs, path = url_to_fs(destination, **(storage_options or {}))
     name = f"write-parquet-{tokenize(fs, array, destination)}"
 
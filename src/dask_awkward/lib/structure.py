@@ -8,13 +8,15 @@ from numbers import Number
 from typing import TYPE_CHECKING, Any
 
 import awkward as ak
+import dask.config
 import numpy as np
 from awkward.types.type import Type
 from awkward.typetracer import create_unknown_scalar, is_unknown_scalar
 from dask.base import is_dask_collection, tokenize, unpack_collections
 from dask.highlevelgraph import HighLevelGraph
+from dask.local import identity
 
-from dask_awkward.layers import AwkwardMaterializedLayer
+from dask_awkward.layers import AwkwardTreeReductionLayer
 from dask_awkward.lib.core import (
     Array,
     PartitionCompatibility,
@@ -617,7 +619,7 @@ def nan_to_num(
     )
 
 
-def _numaxis0(*integers):
+def _numaxis0(integers):
     f = first(integers)
     if is_unknown_scalar(f):
         return f
@@ -644,12 +646,19 @@ def num(
             axis=0,
             meta=ak.Array(ak.Array([1, 1]).layout.to_typetracer(forget_length=True)),
         )
-        name = f"numaxis0-{tokenize(array, axis)}"
-        keys = per_axis.__dask_keys__()
-        matlayer = AwkwardMaterializedLayer(
-            {(name, 0): (_numaxis0, *keys)}, previous_layer_names=[per_axis.name]
+        split_every = dask.config.get("awkward.aggregation.split-every", 8)
+        token = tokenize(array, axis, split_every)
+        name = f"numaxis0-{token}"
+        trl = AwkwardTreeReductionLayer(
+            name=name,
+            name_input=per_axis.name,
+            npartitions_input=per_axis.npartitions,
+            concat_func=_numaxis0,
+            tree_node_func=identity,
+            split_every=split_every,
+            tree_node_name=f"numaxis0-tree-node-{token}",
         )
-        hlg = HighLevelGraph.from_collections(name, matlayer, dependencies=(per_axis,))
+        hlg = HighLevelGraph.from_collections(name, trl, dependencies=(per_axis,))
         return new_scalar_object(
             hlg,
             name,
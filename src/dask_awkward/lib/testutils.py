@@ -8,7 +8,7 @@ from typing import Any
 import awkward as ak
 import numpy as np
 from awkward.typetracer import typetracer_from_form
-from dask.base import is_dask_collection
+from dask.base import compute, is_dask_collection
 from packaging.version import Version
 
 from dask_awkward.lib.core import Array, Record, typetracer_array
@@ -26,6 +26,22 @@ AK_LTE_2_5_0 = Version(ak.__version__) <= Version("2.5.0")
 BAD_NP_AK_MIXIN_VERSIONING = NP_GTE_1_25_0 and AK_LTE_2_2_3
 
 
+def _compute_both(a: Any, b: Any, scheduler: Any) -> tuple[Any, Any]:
+    """Compute `a` and `b` (where they are collections) in a single graph.
+
+    Two collections usually share their input layers; computing them
+    together lets the scheduler run those tasks once.
+    """
+    a_is_coll = is_dask_collection(a)
+    b_is_coll = is_dask_collection(b)
+    if a_is_coll and b_is_coll:
+        return compute(a, b, scheduler=scheduler)
+    return (
+        a.compute(scheduler=scheduler) if a_is_coll else a,
+        b.compute(scheduler=scheduler) if b_is_coll else b,
+    )
+
+
 def assert_eq(
     a: Any,
     b: Any,
@@ -62,8 +78,7 @@ def assert_eq_arrays(
     scheduler = scheduler or DEFAULT_SCHEDULER
     a_is_coll = is_dask_collection(a)
     b_is_coll = is_dask_collection(b)
-    a_comp = a.compute(scheduler=scheduler) if a_is_coll else a
-    b_comp = b.compute(scheduler=scheduler) if b_is_coll else b
+    a_comp, b_comp = _compute_both(a, b, scheduler)
 
     a_tt = typetracer_array(a)
     b_tt = typetracer_array(b)
@@ -105,8 +120,7 @@ def assert_eq_records(
     scheduler: Any | None = None,
 ) -> None:
     scheduler = scheduler or DEFAULT_SCHEDULER
-    ares = a.compute(scheduler=scheduler) if is_dask_collection(a) else a
-    bres = b.compute(scheduler=scheduler) if is_dask_collection(b) else b
+    ares, bres = _compute_both(a, b, scheduler)
 
     assert ares.tolist() == bres.tolist()
 
@@ -117,8 +131,7 @@ def assert_eq_other(
     scheduler: Any | None = None,
 ) -> None:
     scheduler = scheduler or DEFAULT_SCHEDULER
-    ares = a.compute(scheduler=scheduler) if is_dask_collection(a) else a
-    bres = b.compute(scheduler=scheduler) if is_dask_collection(b) else b
+    ares, bres = _compute_both(a, b, scheduler)
     assert ares == bres
 
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 from typing import Any
 
 import awkward as ak
@@ -53,6 +52,22 @@ dtype_of = {
     "u64": np.dtype(np.uint64),
 }
 
+# awkward's form classes are never subclassed, so nodes are classified by
+# exact type rather than walking isinstance chains at every node.
+_NO_CONTENT_FORMS = frozenset({EmptyForm, NumpyForm})
+_ONE_CONTENT_FORMS = frozenset(
+    {
+        BitMaskedForm,
+        ByteMaskedForm,
+        IndexedForm,
+        IndexedOptionForm,
+        ListForm,
+        ListOffsetForm,
+        RegularForm,
+        UnmaskedForm,
+    }
+)
+
 
 def dummy_index_of(typecode: str, length: int, nplike: Any) -> ak.index.Index:
     index_cls = index_of[typecode]
@@ -68,36 +83,27 @@ def compatible(form: Form, layout: Content) -> bool:
     if layout is None:
         return True
 
-    elif isinstance(layout, Content) and type(form) is layout.form_cls:
-        if isinstance(form, (EmptyForm, NumpyForm)):
+    ftype = type(form)
+    if isinstance(layout, Content) and ftype is layout.form_cls:
+        if ftype in _NO_CONTENT_FORMS:
             # 0 contents
             return True
 
-        elif isinstance(
-            form,
-            (
-                BitMaskedForm,
-                ByteMaskedForm,
-                IndexedForm,
-                IndexedOptionForm,
-                ListForm,
-                ListOffsetForm,
-                RegularForm,
-                UnmaskedForm,
-            ),
-        ):
+        elif ftype in _ONE_CONTENT_FORMS:
             # 1 content
             return compatible(form.content, layout.content)
 
-        elif isinstance(form, RecordForm):
+        elif ftype is RecordForm:
             # arbitrarily many contents, possibly with missing fields
-            for field in form.fields:
-                if layout.has_field(field):
-                    if not compatible(form.content(field), layout.content(field)):
+            layout_contents = dict(zip(layout.fields, layout.contents))
+            for field, subform in zip(form.fields, form.contents):
+                layout_content = layout_contents.get(field)
+                if layout_content is not None:
+                    if not compatible(subform, layout_content):
                         return False
             return True
 
-        elif isinstance(form, UnionForm):
+        elif ftype is UnionForm:
             # arbitrarily many contents, possibly with missing fields
             for sublayout in layout.contents:
                 if not any(compatible(subform, sublayout) for subform in form.contents):
@@ -107,7 +113,7 @@ def compatible(form: Form, layout: Content) -> bool:
     elif isinstance(layout, UnmaskedArray) and form.is_option:
         return compatible(form.content, layout.content)
 
-    elif isinstance(form, UnionForm):
+    elif ftype is UnionForm:
         for subform in form.contents:
             if compatible(subform, layout):
                 return True
@@ -122,138 +128,154 @@ def compatible(form: Form, layout: Content) -> bool:
     return False
 
 
+def _placeholder_empty(form, length, backend):
+    return EmptyArray(parameters=form.parameters)
+
+
+def _placeholder_numpy(form, length, backend):
+    return NumpyArray(
+        PlaceholderArray(
+            backend.nplike,
+            (length,) + form.inner_shape,
+            ak.types.numpytype.primitive_to_dtype(form.primitive),
+        ),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_bitmasked(form, length, backend):
+    return BitMaskedArray(
+        dummy_index_of(
+            form.mask,
+            unknown_length if length is unknown_length else (length + 7) >> 3,
+            backend.index_nplike,
+        ),
+        _unproject_layout(form.content, None, length, backend),
+        form.valid_when,
+        length,
+        form.lsb_order,
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_bytemasked(form, length, backend):
+    return ByteMaskedArray(
+        dummy_index_of(form.mask, length, backend.index_nplike),
+        _unproject_layout(form.content, None, length, backend),
+        form.valid_when,
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_indexed(form, length, backend):
+    return IndexedArray(
+        dummy_index_of(form.index, length, backend.index_nplike),
+        _unproject_layout(form.content, None, unknown_length, backend),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_indexedoption(form, length, backend):
+    return IndexedOptionArray(
+        dummy_index_of(form.index, length, backend.index_nplike),
+        _unproject_layout(form.content, None, unknown_length, backend),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_list(form, length, backend):
+    return ListArray(
+        dummy_index_of(form.starts, length, backend.index_nplike),
+        dummy_index_of(form.stops, length, backend.index_nplike),
+        _unproject_layout(form.content, None, unknown_length, backend),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_listoffset(form, length, backend):
+    return ListOffsetArray(
+        dummy_index_of(form.offsets, length + 1, backend.index_nplike),
+        _unproject_layout(form.content, None, unknown_length, backend),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_regular(form, length, backend):
+    return RegularArray(
+        _unproject_layout(form.content, None, length * form.size, backend),
+        form.size,
+        length,
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_unmasked(form, length, backend):
+    return UnmaskedArray(
+        _unproject_layout(form.content, None, length, backend),
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_record(form, length, backend):
+    return RecordArray(
+        [
+            _unproject_layout(content, None, length, backend)
+            for content in form.contents
+        ],
+        None if form.is_tuple else form.fields,
+        length,
+        parameters=form.parameters,
+    )
+
+
+def _placeholder_union(form, length, backend):
+    return UnionArray(
+        dummy_index_of(form.tags, length, backend.index_nplike),
+        dummy_index_of(form.index, length, backend.index_nplike),
+        [
+            _unproject_layout(content, None, unknown_length, backend)
+            for content in form.contents
+        ],
+        parameters=form.parameters,
+    )
+
+
+# builders for the "minimum necessary" layout of each form type.
+_placeholder_of = {
+    EmptyForm: _placeholder_empty,
+    NumpyForm: _placeholder_numpy,
+    BitMaskedForm: _placeholder_bitmasked,
+    ByteMaskedForm: _placeholder_bytemasked,
+    IndexedForm: _placeholder_indexed,
+    IndexedOptionForm: _placeholder_indexedoption,
+    ListForm: _placeholder_list,
+    ListOffsetForm: _placeholder_listoffset,
+    RegularForm: _placeholder_regular,
+    UnmaskedForm: _placeholder_unmasked,
+    RecordForm: _placeholder_record,
+    UnionForm: _placeholder_union,
+}
+
+
 def _unproject_layout(form, layout, length, backend):
+    ftype = type(form)
     if layout is None:
         # construct the "minimum necessary" layout
         # maintaining length constraints if there are any, 0 otherwise
+        try:
+            placeholder = _placeholder_of[ftype]
+        except KeyError:
+            raise AssertionError(f"unrecognized Form type: {ftype}") from None
+        return placeholder(form, length, backend)
 
-        if isinstance(form, EmptyForm):
-            return EmptyArray(parameters=form.parameters)
-
-        elif isinstance(form, NumpyForm):
-            return NumpyArray(
-                PlaceholderArray(
-                    backend.nplike,
-                    (length,) + form.inner_shape,
-                    ak.types.numpytype.primitive_to_dtype(form.primitive),
-                ),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, BitMaskedForm):
-            return BitMaskedArray(
-                dummy_index_of(
-                    form.mask,
-                    (
-                        unknown_length
-                        if length is unknown_length
-                        else math.ceil(length / 8.0)
-                    ),
-                    backend.index_nplike,
-                ),
-                _unproject_layout(form.content, None, length, backend),
-                form.valid_when,
-                length,
-                form.lsb_order,
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, ByteMaskedForm):
-            return ByteMaskedArray(
-                dummy_index_of(form.mask, length, backend.index_nplike),
-                _unproject_layout(form.content, None, length, backend),
-                form.valid_when,
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, IndexedForm):
-            return IndexedArray(
-                dummy_index_of(form.index, length, backend.index_nplike),
-                _unproject_layout(form.content, None, unknown_length, backend),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, IndexedOptionForm):
-            return IndexedOptionArray(
-                dummy_index_of(form.index, length, backend.index_nplike),
-                _unproject_layout(form.content, None, unknown_length, backend),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, ListForm):
-            return ListArray(
-                dummy_index_of(form.starts, length, backend.index_nplike),
-                dummy_index_of(form.stops, length, backend.index_nplike),
-                _unproject_layout(form.content, None, unknown_length, backend),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, ListOffsetForm):
-            return ListOffsetArray(
-                dummy_index_of(form.offsets, length + 1, backend.index_nplike),
-                _unproject_layout(form.content, None, unknown_length, backend),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, RegularForm):
-            return RegularArray(
-                _unproject_layout(form.content, None, length * form.size, backend),
-                form.size,
-                length,
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, UnmaskedForm):
-            return UnmaskedArray(
-                _unproject_layout(form.content, None, length, backend),
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, RecordForm):
-            return RecordArray(
-                [
-                    _unproject_layout(content, None, length, backend)
-                    for content in form.contents
-                ],
-                None if form.is_tuple else form.fields,
-                length,
-                parameters=form.parameters,
-            )
-
-        elif isinstance(form, UnionForm):
-            return UnionArray(
-                dummy_index_of(form.tags, length, backend.index_nplike),
-                dummy_index_of(form.index, length, backend.index_nplike),
-                [
-                    _unproject_layout(content, None, unknown_length, backend)
-                    for content in form.contents
-                ],
-                parameters=form.parameters,
-            )
-
-        else:
-            raise AssertionError(f"unrecognized Form type: {type(form)}")
-
-    elif isinstance(layout, Content) and type(form) is layout.form_cls:
+    if isinstance(layout, Content) and ftype is layout.form_cls:
         # pass on this layout node, allowing for descendants to be missing
 
-        if isinstance(form, (EmptyForm, NumpyForm)):
+        if ftype in _NO_CONTENT_FORMS:
             # 0 contents
             return layout
 
-        elif isinstance(
-            form,
-            (
-                BitMaskedForm,
-                ByteMaskedForm,
-                IndexedForm,
-                IndexedOptionForm,
-                ListForm,
-                ListOffsetForm,
-                RegularForm,
-                UnmaskedForm,
-            ),
-        ):
+        elif ftype in _ONE_CONTENT_FORMS:
             # 1 content
             return layout.copy(
                 content=_unproject_layout(
@@ -261,24 +283,22 @@ def _unproject_layout(form, layout, length, backend):
                 )
             )
 
-        elif isinstance(form, RecordForm):
-            # arbitrarily many contents, possibly with missing fields
+        elif ftype is RecordForm:
+            # arbitrarily many contents, possibly with missing fields.
+            # has_field/content(field) search the field list, which is
+            # quadratic over wide records; look each field up once.
+            layout_contents = dict(zip(layout.fields, layout.contents))
             contents = []
-            for field in form.fields:
-                if layout.has_field(field):
-                    layout_content = layout.content(field)
+            for field, subform in zip(form.fields, form.contents):
+                layout_content = layout_contents.get(field)
+                if layout_content is not None:
                     contents.append(
                         _unproject_layout(
-                            form.content(field),
-                            layout_content,
-                            layout_content.length,
-                            backend,
+                            subform, layout_content, layout_content.length, backend
                         )
                     )
                 else:
-                    contents.append(
-                        _unproject_layout(form.content(field), None, length, backend)
-                    )
+                    contents.append(_unproject_layout(subform, None, length, backend))
 
             return RecordArray(
                 contents,
@@ -287,22 +307,25 @@ def _unproject_layout(form, layout, length, backend):
                 parameters=form.parameters,
             )
 
-        elif isinstance(form, UnionForm):
+        elif ftype is UnionForm:
             # arbitrarily many contents, possibly with missing fields
-            available = dict(enumerate(layout.contents))
+            consumed = [False] * len(layout.contents)
 
-            newtags = backend.empty_like(layout.tags.data)
+            # old tag -> new tag, applied to the tags buffer in a single
+            # gather rather than one masked pass per content.
+            remap = np.empty(len(layout.contents), dtype=np.int8)
             contents = []
             for newtag, subform in enumerate(form.contents):
-                for oldtag, sublayout in available.items():
-                    if compatible(subform, sublayout):
+                for oldtag, sublayout in enumerate(layout.contents):
+                    if not consumed[oldtag] and compatible(subform, sublayout):
                         contents.append(sublayout)
-                        newtags[layout.tags.data == oldtag] = newtag
-                        del available[oldtag]
+                        remap[oldtag] = newtag
+                        consumed[oldtag] = True
                         break
                 else:
                     contents.append(_unproject_layout(subform, None, 0, backend))
 
+            newtags = backend.index_nplike.asarray(remap)[layout.tags.data]
             return UnionArray(
                 ak.index.Index8(newtags),
                 layout.index,
@@ -315,9 +338,9 @@ def _unproject_layout(form, layout, length, backend):
 
     # UnmaskedArray, non-UnmaskedArray form
     elif isinstance(layout, UnmaskedArray) and form.is_option:
-        if isinstance(form, BitMaskedForm):
+        if ftype is BitMaskedForm:
             byte_length = (
-                unknown_length if length is unknown_length else math.ceil(length / 8.0)
+                unknown_length if length is unknown_length else (length + 7) >> 3
             )
             return BitMaskedArray(
                 ak.index.Index(
@@ -333,7 +356,7 @@ def _unproject_layout(form, layout, length, backend):
                 form.lsb_order,
                 parameters=layout._parameters,
             )
-        elif isinstance(form, ByteMaskedForm):
+        elif ftype is ByteMaskedForm:
             return ByteMaskedArray(
                 ak.index.Index(
                     backend.index_nplike.full(length, 1, dtype=np.int8)
@@ -346,7 +369,7 @@ def _unproject_layout(form, layout, length, backend):
                 form.valid_when,
                 parameters=layout._parameters,
             )
-        elif isinstance(form, IndexedOptionForm):
+        elif ftype is IndexedOptionForm:
             return IndexedOptionArray(
                 ak.index.Index64(
                     backend.index_nplike.arange(layout.length, dtype=np.int64),
@@ -365,21 +388,25 @@ def _unproject_layout(form, layout, length, backend):
     elif isinstance(layout, UnmaskedArray) and not form.is_option:
         return _unproject_layout(form, layout.content, layout.content.length, backend)
 
-    elif isinstance(form, UnionForm):
+    elif ftype is UnionForm:
         newtags, newindex = None, None
         contents = []
         for newtag, subform in enumerate(form.contents):
             if compatible(subform, layout):
                 contents.append(layout)
-                newtags = backend.full(layout.length, newtag, dtype=np.int8)
-                newindex = backend.arange(layout.length, dtype=dtype_of[form.index])
+                newtags = backend.index_nplike.full(
+                    layout.length, newtag, dtype=np.int8
+                )
+                newindex = backend.index_nplike.arange(
+                    layout.length, dtype=dtype_of[form.index]
+                )
             else:
                 contents.append(_unproject_layout(subform, None, 0, backend))
 
         assert newtags is not None and newindex is not None
         return UnionArray(
             ak.index.Index8(newtags),
-            ak.index.Index(newindex),
+            index_of[form.index](newindex),
             contents,
             parameters=form.parameters,
         )
@@ -387,7 +414,7 @@ def _unproject_layout(form, layout, length, backend):
     # handle other cases that come up here...
 
     else:
-        raise AssertionError(f"unexpected combination: {type(form)} and {type(layout)}")
+        raise AssertionError(f"unexpected combination: {ftype} and {type(layout)}")
 
 
 def unproject_layout(form: Form | None, layout: Content) -> Content:
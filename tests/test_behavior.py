@@ -95,6 +95,29 @@ def test_property_method_behavior(daa_p1: dak.Array, caa_p1: ak.Array) -> None:
     assert daa.some_method_both() == caa.some_method_both() == "NO DISPATCH!"
 
 
+@ak.mixin_class(behaviors)
+class Hidden:
+    @dak.dask_property
+    def _hidden(self):
+        return self.x * 2
+
+    @_hidden.dask
+    def _hidden_dask(self, array):
+        return array.x * 2
+
+
+@pytest.mark.xfail(
+    BAD_NP_AK_MIXIN_VERSIONING,
+    reason="NumPy 1.25 mixin __slots__ change",
+)
+def test_private_dask_property() -> None:
+    caa = ak.Array([{"x": 1}, {"x": 2}], with_name="Hidden", behavior=behaviors)
+    daa = dak.from_awkward(caa, npartitions=2)
+    assert caa._hidden.tolist() == [2, 4]
+    assert_eq(daa._hidden, caa._hidden)
+    assert not hasattr(daa, "_not_a_behavior")
+
+
 @pytest.mark.xfail(
     BAD_NP_AK_MIXIN_VERSIONING,
     reason="NumPy 1.25 mixin __slots__ change",
@@ -149,6 +149,15 @@ def test_partitions(ndjson_points_file: str) -> None:
         assert part.npartitions == 1
 
 
+def test_partitions_fancy_index(daa: Array, caa: ak.Array) -> None:
+    parts = [daa.partitions[i].compute() for i in range(daa.npartitions)]
+    assert_eq(daa.partitions[[0, 2]], ak.concatenate([parts[0], parts[2]]))
+    mask = [i % 2 == 1 for i in range(daa.npartitions)]
+    assert_eq(daa.partitions[mask], ak.concatenate(parts[1::2]))
+    assert_eq(daa.partitions[-1], parts[-1])
+    assert_eq(daa.partitions[:], caa)
+
+
 def test_partitions_divisions(ndjson_points_file: str) -> None:
     daa = dak.from_json([ndjson_points_file] * 3)
     daa.eager_compute_divisions()
@@ -160,6 +169,17 @@ def test_partitions_divisions(ndjson_points_file: str) -> None:
     assert t2.divisions == (0, divs[2] - divs[1])
 
 
+def test_dask_keys_follow_setitem(daa: Array) -> None:
+    daa = daa[["points"]]
+    keys = daa.__dask_keys__()
+    assert keys == [(daa.name, i) for i in range(daa.npartitions)]
+    # the cached keys are handed out as-is
+    assert daa.__dask_keys__() is keys
+    daa["xx"] = daa.points.x
+    assert daa.__dask_keys__() == [(daa.name, i) for i in range(daa.npartitions)]
+    assert [tuple(k) for k in daa.keys_array.tolist()] == daa.__dask_keys__()
+
+
 def test_array_rebuild(ndjson_points_file: str) -> None:
     daa = dak.from_json([ndjson_points_file])
     x = daa.compute()
@@ -991,3 +1011,11 @@ def test_map_partitions_deterministic_token():
     assert (
         map_partitions(f, {0: dask_arr}).name == map_partitions(f, {0: dask_arr}).name
     )
+
+
+def test_map_partitions_token_depends_on_kwargs(daa):
+    a = map_partitions(ak.count, daa.points.x, axis=1)
+    b = map_partitions(ak.count, daa.points.x, axis=1)
+    c = map_partitions(ak.count, daa.points.x, axis=1, keepdims=True)
+    assert a.name == b.name
+    assert a.name != c.name
@@ -22,6 +22,15 @@ def test_getattr_raise(daa: dak.Array) -> None:
         assert dar.x3
 
 
+def test_getattr_private_names() -> None:
+    daa = dak.from_awkward(ak.Array([{"x": 1, "_y": 2}]), npartitions=1)
+    with pytest.raises(AttributeError, match="not in fields"):
+        assert daa._layout
+    assert not hasattr(daa, "_not_a_field")
+    # private field names are still fields
+    assert_eq(daa._y, ak.Array([2]))
+
+
 def test_multi_string(daa: dak.Array, caa: ak.Array) -> None:
     assert_eq(
         daa["points"][["x", "y"]],
@@ -221,3 +221,107 @@ def test_to_and_from_json(
     suffix = "gz" if compression == "gzip" else compression
     r = dak.from_json(os.path.join(tdir, f"*.json.{suffix}"))
     assert_eq(x, r)
+
+
+def test_json_one_obj_per_file_toplevel_list(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    d = tmp_path_factory.mktemp("sopf_list")
+    p = str(d / "file.json")
+    with open(p, "w") as f:
+        print(json.dumps([{"x": 1, "y": [1, 2]}, {"x": 2, "y": []}]), file=f)
+
+    daa = dak.from_json([p] * 3, line_delimited=False)
+    single = ak.from_json(Path(p), line_delimited=False)
+    caa = ak.concatenate([ak.Array([single])] * 3)
+    assert_eq(daa, caa)
+
+
+def test_json_meta_sample_rows(tmp_path_factory: pytest.TempPathFactory) -> None:
+    d = tmp_path_factory.mktemp("sample_rows")
+    p = str(d / "file.json.gz")
+    with fsspec.open(p, "wt", compression="gzip") as f:
+        print('{"a": 1}\n{"a": 2.5}\n{"a": 3}', file=f)
+
+    # compressed files are sampled line by line; with a single line
+    # sampled the field is typed as int
+    daa = dak.from_json(p, meta_sample_rows=1)
+    assert str(daa.layout.form.type) == "{a: int64}"
+    daa = dak.from_json(p, meta_sample_rows=2)
+    assert str(daa.layout.form.type) == "{a: float64}"
+
+
+def test_json_compressed_blocksize_raises(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    d = tmp_path_factory.mktemp("compressed_blocksize")
+    p = str(d / "file.json.gz")
+    with fsspec.open(p, "wt", compression="gzip") as f:
+        print('{"a": 1}\n{"a": 2}', file=f)
+
+    with pytest.raises(ValueError, match="Cannot do chunked reads"):
+        dak.from_json(p, blocksize=4096)
+
+
+def test_json_projection_schema_cached(json_data_dir: Path) -> None:
+    from dask_awkward.lib.io.json import _jsonschema_for_columns
+
+    ds = dak.from_json(os.path.join(str(json_data_dir), "*.json"))
+    s1 = _jsonschema_for_columns(ds.form, ["name", "goals"])
+    s2 = _jsonschema_for_columns(ds.form, ["name", "goals"])
+    assert s1 is s2
+    assert list(s1["properties"]) == ["name", "goals"]
+
+
+def test_form_to_jsonschema_matches_layout(daa: Array) -> None:
+    from dask_awkward.lib.io.json import _form_to_jsonschema
+
+    form = daa.form
+    layout = form.length_zero_array(highlevel=False)
+    assert _form_to_jsonschema(form) == dak.layout_to_jsonschema(layout)
+    assert _form_to_jsonschema(form, required=True) == dak.layout_to_jsonschema(
+        layout, required=True
+    )
+
+
+def test_json_meta_first_line_longer_than_sample(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    d = tmp_path_factory.mktemp("long_line")
+    p = str(d / "file.json")
+    with open(p, "w") as f:
+        for i in range(3):
+            print(json.dumps({"x": list(range(500)), "i": i}), file=f)
+
+    daa = dak.from_json(p, meta_sample_bytes=64)
+    assert daa.fields == ["x", "i"]
+    assert daa.i.compute().tolist() == [0, 1, 2]
+
+
+def test_json_deterministic_name(json_data_dir: Path) -> None:
+    source = os.path.join(str(json_data_dir), "*.json")
+    assert dak.from_json(source).name == dak.from_json(source).name
+    f0, f1 = (os.path.join(str(json_data_dir), f"file{i}.json") for i in (0, 1))
+    assert dak.from_json(f0).name != dak.from_json(f1).name
+    assert dak.from_json(source).name != dak.from_json(source, buffersize=1024).name
+    assert (
+        dak.from_json(source).name
+        != dak.from_json(source, schema={"type": "object"}).name
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"line_delimited": False}, {"blocksize": 1024}])
+def test_json_name_changes_when_rewritten(
+    tmp_path_factory: pytest.TempPathFactory, kwargs: dict
+) -> None:
+    p = str(tmp_path_factory.mktemp("rewritten") / "file.json")
+    with open(p, "w") as f:
+        f.write('{"a": 1}\n')
+    before = dak.from_json(p, **kwargs)
+    assert before.name == dak.from_json(p, **kwargs).name
+    # same form, different contents
+    with open(p, "w") as f:
+        f.write('{"a": 22}\n')
+    after = dak.from_json(p, **kwargs)
+    assert after.name != before.name
+    assert after.compute().tolist() == [{"a": 22}]
@@ -79,6 +79,16 @@ def test_multiple_computes_multiple_incapsulated(daa, caa):
     assert_eq(opt4_alone, opt4)
 
 
+def test_reduction_chain_fused(daa, caa):
+    # the partitionwise steps feeding a tree reduction (input layer,
+    # count, axis=None preparation, and per-chunk reduction) should
+    # end up in a single layer after optimization.
+    dres = dak.sum(dak.count(daa.points.x, axis=1), axis=None)
+    (opt,) = dask.optimize(dres)
+    assert len(opt.dask.layers) == 2
+    assert opt.compute() == ak.sum(ak.count(caa.points.x, axis=1), axis=None)
+
+
 def test_optimization_runs_on_multiple_collections_gh430(tmp_path_factory):
     pytest.importorskip("pyarrow")
     d = tmp_path_factory.mktemp("opt")
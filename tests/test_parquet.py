@@ -214,3 +214,132 @@ def test_from_parquet_with_report(
     c_ds, c_report = dask.compute(dak.max(ds.points.x, axis=1), report)
     assert len(c_ds)
     assert c_report.columns.tolist()[0] == ["points.list.item.x"]
+
+
+def test_row_groups_share_footer(tmp_path: pathlib.Path) -> None:
+    from dask_awkward.lib.io.parquet import _footer_cache
+
+    path = str(tmp_path / "rgs.parquet")
+    caa = ak.Array({"x": list(range(100)), "y": [[i] * (i % 3) for i in range(100)]})
+    ak.to_parquet(caa, path, row_group_size=10)
+    daa = dak.from_parquet(path, split_row_groups=True)
+    assert daa.npartitions == 10
+
+    _footer_cache.clear()
+    assert_eq(daa, caa, check_forms=False)
+    assert_eq(daa.y, caa.y, check_forms=False)
+    assert len(_footer_cache) == 1
+
+    # a rewritten file must not be read with the old footer.
+    ak.to_parquet(caa[::-1], path, row_group_size=10)
+    daa = dak.from_parquet(path, split_row_groups=True)
+    assert daa.x.compute().tolist() == caa.x[::-1].tolist()
+
+
+def test_footer_cache_threaded(tmp_path: pathlib.Path) -> None:
+    from dask_awkward.lib.io.parquet import _footer_cache
+
+    # more files than the footer cache holds, so entries are evicted
+    # while other worker threads are reading.
+    nfiles = _footer_cache.maxsize + 72
+    paths = [str(tmp_path / f"part{i:03}.parquet") for i in range(nfiles)]
+    for i, path in enumerate(paths):
+        ak.to_parquet(ak.Array({"x": [i, i + 1]}), path, row_group_size=1)
+    _metadata_file_from_data_files(paths, fs, str(tmp_path))
+    daa = dak.from_parquet(str(tmp_path), ignore_metadata=False, split_row_groups=True)
+    assert daa.npartitions == 2 * nfiles
+
+    _footer_cache.clear()
+    result = daa.x.compute(scheduler="threads", num_workers=8)
+    assert result.tolist() == [j for i in range(nfiles) for j in (i, i + 1)]
+
+
+def test_coalesce_row_groups(tmp_path: pathlib.Path) -> None:
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "rgs.parquet")
+    caa = ak.Array({"x": list(range(100))})
+    ak.to_parquet(caa, path, row_group_size=10)
+    rg_size = pq.read_metadata(path).row_group(0).total_byte_size
+
+    daa = dak.from_parquet(path, split_row_groups=True, coalesce_row_groups=3 * rg_size)
+    assert daa.npartitions == 4
+    assert daa.divisions == (0, 30, 60, 90, 100)
+    assert_eq(daa, caa, check_forms=False)
+    assert_eq(daa.partitions[3], caa[90:], check_forms=False)
+
+    daa = dak.from_parquet(path, split_row_groups=True, coalesce_row_groups=1)
+    assert daa.npartitions == 10
+
+
+def test_dir_of_two_files_metadata_split_row_groups(tmpdir):
+    tmpdir = str(tmpdir)
+    paths = ["/".join([tmpdir, _]) for _ in ["part-0.parquet", "part-1.parquet"]]
+    pad.write_dataset(pa.table({"x": [1, 2, 3]}), tmpdir, format="parquet")
+    fs.cp(paths[0], paths[1])
+    _metadata_file_from_data_files(paths, fs, tmpdir)
+
+    arr = dak.from_parquet(tmpdir, ignore_metadata=False, split_row_groups=True)
+    assert arr.npartitions == 2
+    assert arr.divisions == (0, 3, 6)
+    assert arr.x.compute().to_list() == [1, 2, 3] * 2
+
+
+def test_to_parquet_partitions_per_file(daa: dak.Array, tmp_path: pathlib.Path) -> None:
+    assert daa.npartitions == 3
+    dak.to_parquet(daa, str(tmp_path), partitions_per_file=2)
+    assert sorted(p.name for p in tmp_path.glob("*")) == [
+        "part0.parquet",
+        "part1.parquet",
+    ]
+    assert_eq(
+        dak.from_parquet(str(tmp_path)), daa, check_forms=False, check_divisions=False
+    )
+
+    with pytest.raises(ValueError, match="positive integer"):
+        dak.to_parquet(daa, str(tmp_path), partitions_per_file=0)
+
+
+@pytest.mark.parametrize("npartitions", [1, 10, 11])
+def test_to_parquet_part_names(tmp_path: pathlib.Path, npartitions: int) -> None:
+    arr = dak.from_awkward(ak.Array(list(range(110))), npartitions=npartitions)
+    assert arr.npartitions == npartitions
+    dak.to_parquet(arr, str(tmp_path), prefix="a")
+    width = len(str(npartitions - 1))
+    assert sorted(p.name for p in tmp_path.glob("*")) == [
+        f"a-part{str(i).zfill(width)}.parquet" for i in range(npartitions)
+    ]
+
+
+def test_from_parquet_meta_reused(tmp_path: pathlib.Path) -> None:
+    from dask_awkward.lib.io.columnar import _mock_layout_cache
+
+    path = str(tmp_path / "meta.parquet")
+    ak.to_parquet(ak.Array([{"x": 1, "y": [1.0]}]), path)
+    _mock_layout_cache.clear()
+
+    a = dak.from_parquet(path)
+    b = dak.from_parquet(path, attrs={"a": 1})
+    assert len(_mock_layout_cache) == 1
+    assert a._meta.layout is b._meta.layout
+    assert a._meta is not b._meta
+    assert b.attrs == {"a": 1}
+    assert a.attrs == {}
+
+
+def test_project_all_columns_skips_unproject(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "proj.parquet")
+    ak.to_parquet(ak.Array([{"x": 1, "y": [1.0]}, {"x": 2, "y": []}]), path)
+    daa = dak.from_parquet(path)
+    io_func = daa.dask.layers[daa.name].io_func
+
+    assert io_func.project_columns(["x", "y"]).original_form is None
+    assert io_func.project_columns(["x"]).original_form == io_func.form
+
+
+def test_unnamed_root_compliant_nested(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "unnamed.parquet")
+    caa = ak.Array([[1, 2], [3]])
+    ak.to_parquet(caa, path, parquet_compliant_nested=True)
+    daa = dak.from_parquet(path)
+    assert daa.compute().tolist() == caa.tolist()
@@ -207,3 +207,10 @@ def test_std(daa: dak.Array, caa: ak.Array, axis: int, attr: str) -> None:
     ar = ak.std(caa.points[attr], axis=axis)
     dr = dak.std(daa.points[attr], axis=axis)
     assert_eq(ar, dr, isclose_equal_nan=True)
+
+
+def test_axis_none_single_chunk_layer(daa: dak.Array) -> None:
+    x = daa.points.x
+    r = dak.sum(x, axis=None)
+    # one layer for the per-partition reduction and one for the tree
+    assert len(r.dask.layers) == len(x.dask.layers) + 2
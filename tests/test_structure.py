@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 import awkward as ak
+import dask
 import numpy as np
 import pytest
 
@@ -34,6 +35,15 @@ def test_num(caa: ak.Array, daa: dak.Array, axis: int) -> None:
     assert_eq(dak.num(da.x, axis=axis), ak.num(ca.x, axis=axis))
 
 
+def test_num_axis0_tree(caa: ak.Array, daa: dak.Array) -> None:
+    da = dak.concatenate([daa] * 4)
+    ca = ak.concatenate([caa] * 4)
+    assert not da.known_divisions
+    with dask.config.set({"awkward.aggregation.split-every": 2}):
+        n = dak.num(da, axis=0)
+    assert n.compute() == ak.num(ca, axis=0)
+
+
 def test_zip_dict_input(caa: ak.Array, daa: dak.Array) -> None:
     da1 = daa["points"]["x"]
     da2 = daa["points"]["x"]
@@ -1,6 +1,7 @@
 import awkward as ak
+import pytest
 
-from dask_awkward.lib.unproject_layout import unproject_layout
+from dask_awkward.lib.unproject_layout import _unproject_layout, unproject_layout
 
 
 def _compare_values(index, projected, x, unprojected):
@@ -113,3 +114,52 @@ def test_ByteMaskedArray():
     form = ak.forms.ByteMaskedForm("u8", ak.forms.NumpyForm("int64"), valid_when=True)
     unprojected = unproject_layout(form, projected)
     compare_values(projected, unprojected)
+
+
+def test_placeholder_form_types():
+    int64 = ak.forms.NumpyForm("int64")
+    contents = {
+        "numpy": int64,
+        "bitmasked": ak.forms.BitMaskedForm("u8", int64, True, True),
+        "bytemasked": ak.forms.ByteMaskedForm("i8", int64, True),
+        "indexed": ak.forms.IndexedForm("i64", int64),
+        "indexedoption": ak.forms.IndexedOptionForm("i64", int64),
+        "list": ak.forms.ListForm("i64", "i64", int64),
+        "listoffset": ak.forms.ListOffsetForm("i64", int64),
+        "regular": ak.forms.RegularForm(int64, 3),
+        "unmasked": ak.forms.UnmaskedForm(int64),
+        "record": ak.forms.RecordForm([int64], ["a"]),
+        "union": ak.forms.UnionForm(
+            "i8", "i64", [int64, ak.forms.ListOffsetForm("i64", int64)]
+        ),
+    }
+    form = ak.forms.RecordForm(
+        [ak.forms.NumpyForm("int64"), *contents.values()], ["x", *contents]
+    )
+    projected = ak.from_iter([{"x": 1}, {"x": 2}, {"x": 3}], highlevel=False)
+    unprojected = unproject_layout(form, projected)
+    assert unprojected.form.is_equal_to(form)
+    assert unprojected.length == 3
+    compare_values(projected, unprojected)
+
+
+def test_UnionArray_present():
+    form = ak.from_iter(
+        [{"x": 1, "y": 1}, {"x": 2, "y": "two"}, {"x": 3, "y": 3}], highlevel=False
+    ).form
+    for y in ([1, "two", 3], ["one", 2, 3]):
+        projected = ak.from_iter([{"y": v} for v in y], highlevel=False)
+        unprojected = unproject_layout(form, projected)
+        assert unprojected.content("y").form.is_equal_to(form.content("y"))
+        assert ak.to_list(unprojected.content("y")) == y
+
+    # the layout holds only one of the union's contents
+    projected = ak.from_iter([{"y": 1}, {"y": 2}, {"y": 3}], highlevel=False)
+    unprojected = unproject_layout(form, projected)
+    assert unprojected.content("y").form.is_equal_to(form.content("y"))
+    assert ak.to_list(unprojected.content("y").project(0)) == [1, 2, 3]
+
+
+def test_unrecognized_form_type():
+    with pytest.raises(AssertionError, match="unrecognized Form type"):
+        _unproject_layout(object(), None, 3, None)